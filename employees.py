@@ -9,65 +9,143 @@ Defines all 47 employees of Nexus Software Solutions with their roles,
 personalities, skills, and behaviors.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple, Union
 from dataclasses import dataclass, field
-from enum import Enum
+from enum import IntEnum, IntFlag
+from collections import Counter, defaultdict
 import random
+import sys
 
 
-class Team(Enum):
+class Team(IntEnum):
     """Employee team classifications."""
-    ARCHITECTURE = "Architecture"
-    FRONTEND = "Frontend"
-    BACKEND = "Backend"
-    QA = "QA"
-    DEVOPS = "DevOps"
-    PRODUCT = "Product Management"
-    DATA = "Data Analytics"
-    CUSTOMER_SUCCESS = "Customer Success"
-    EXECUTIVE = "Executive"
-    SECURITY = "Security"
-    DESIGN = "Design"
-    INTERN = "Intern"
-
-
-class Skill(Enum):
-    """Technical and soft skills."""
-    PYTHON = "Python"
-    JAVASCRIPT = "JavaScript"
-    TYPESCRIPT = "TypeScript"
-    REACT = "React"
-    NODEJS = "Node.js"
-    DATABASES = "Databases"
-    CLOUD = "Cloud Infrastructure"
-    SECURITY = "Security"
-    TESTING = "Testing"
-    DESIGN = "Design"
-    LEADERSHIP = "Leadership"
-    COMMUNICATION = "Communication"
-    ARCHITECTURE = "Architecture"
-    DEVOPS = "DevOps"
-    DATA_ANALYSIS = "Data Analysis"
-    PROJECT_MANAGEMENT = "Project Management"
-    UX = "UX Design"
-    UI = "UI Design"
-
-
-@dataclass
+    ARCHITECTURE = 0
+    FRONTEND = 1
+    BACKEND = 2
+    QA = 3
+    DEVOPS = 4
+    PRODUCT = 5
+    DATA = 6
+    CUSTOMER_SUCCESS = 7
+    EXECUTIVE = 8
+    SECURITY = 9
+    DESIGN = 10
+    INTERN = 11
+
+    @property
+    def label(self) -> str:
+        """Human-readable team name."""
+        return TEAM_NAMES[self]
+
+
+# Display names indexed by Team value
+TEAM_NAMES = (
+    "Architecture",
+    "Frontend",
+    "Backend",
+    "QA",
+    "DevOps",
+    "Product Management",
+    "Data Analytics",
+    "Customer Success",
+    "Executive",
+    "Security",
+    "Design",
+    "Intern",
+)
+
+
+class Skill(IntFlag):
+    """Technical and soft skills (one bit each, so skill sets pack into a mask)."""
+    PYTHON = 1 << 0
+    JAVASCRIPT = 1 << 1
+    TYPESCRIPT = 1 << 2
+    REACT = 1 << 3
+    NODEJS = 1 << 4
+    DATABASES = 1 << 5
+    CLOUD = 1 << 6
+    SECURITY = 1 << 7
+    TESTING = 1 << 8
+    DESIGN = 1 << 9
+    LEADERSHIP = 1 << 10
+    COMMUNICATION = 1 << 11
+    ARCHITECTURE = 1 << 12
+    DEVOPS = 1 << 13
+    DATA_ANALYSIS = 1 << 14
+    PROJECT_MANAGEMENT = 1 << 15
+    UX = 1 << 16
+    UI = 1 << 17
+
+    @property
+    def label(self) -> str:
+        """Human-readable skill name; combined flags join their members' names."""
+        label = _SKILL_LABELS.get(self)
+        if label is None:
+            label = ", ".join(_SKILL_LABELS[skill] for skill in self)
+        return label
+
+
+_SKILL_LABELS = {
+    Skill.PYTHON: "Python",
+    Skill.JAVASCRIPT: "JavaScript",
+    Skill.TYPESCRIPT: "TypeScript",
+    Skill.REACT: "React",
+    Skill.NODEJS: "Node.js",
+    Skill.DATABASES: "Databases",
+    Skill.CLOUD: "Cloud Infrastructure",
+    Skill.SECURITY: "Security",
+    Skill.TESTING: "Testing",
+    Skill.DESIGN: "Design",
+    Skill.LEADERSHIP: "Leadership",
+    Skill.COMMUNICATION: "Communication",
+    Skill.ARCHITECTURE: "Architecture",
+    Skill.DEVOPS: "DevOps",
+    Skill.DATA_ANALYSIS: "Data Analysis",
+    Skill.PROJECT_MANAGEMENT: "Project Management",
+    Skill.UX: "UX Design",
+    Skill.UI: "UI Design",
+}
+
+
+def skills_to_mask(skills: Union[List[Skill], int]) -> int:
+    """
+    Pack a list of skills into a bitmask.
+    An already-packed mask (e.g. Skill.UX | Skill.UI) is returned as-is, so
+    callers filtering in a loop can pack their required skills once.
+    """
+    if isinstance(skills, int):
+        return int(skills)
+    # OR the plain int values: IntFlag's own | builds a pseudo-member per step
+    mask = 0
+    for skill in skills:
+        mask |= skill._value_
+    return mask
+
+
+@dataclass(slots=True)
 class Employee:
     """Represents an employee at Nexus Software Solutions."""
     name: str
     role: str
     team: Team
-    skills: List[Skill]
-    personality_traits: List[str]
-    quirks: List[str] = field(default_factory=list)
+    skills: Tuple[Skill, ...]
+    personality_traits: Tuple[str, ...]
+    quirks: Tuple[str, ...] = ()
     current_task: Optional[str] = None
     location: str = "Not assigned"
     available: bool = True
+    skills_mask: int = field(init=False, repr=False, compare=False)
+    skill_labels: Tuple[str, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Roles and locations repeat across the roster; share one string each
+        self.role = sys.intern(self.role)
+        self.location = sys.intern(self.location)
+        self.skills_mask = skills_to_mask(self.skills)
+        self.skill_labels = tuple([_SKILL_LABELS[skill] for skill in self.skills])
 
     def __repr__(self) -> str:
-        return f"Employee({self.name}, {self.role}, {self.team.value})"
+        return f"Employee({self.name}, {self.role}, {self.team.label})"
 
     def assign_task(self, task: str) -> None:
         """Assign a task to this employee."""
@@ -83,7 +161,7 @@ class Employee:
 
     def get_introduction(self) -> str:
         """Get employee introduction message."""
-        return f"{self.name} - {self.role} ({self.team.value})"
+        return f"{self.name} - {self.role} ({self.team.label})"
 
     def say(self, message: str, context: str = "") -> str:
         """Generate employee dialogue."""
@@ -92,7 +170,409 @@ class Employee:
 
     def can_help_with(self, required_skills: List[Skill]) -> bool:
         """Check if employee has required skills."""
-        return any(skill in self.skills for skill in required_skills)
+        return bool(self.skills_mask & skills_to_mask(required_skills))
+
+
+class EmployeeRegistry:
+    """
+    Employee roster with lookup indexes built once up front.
+    Name, team and skill queries cost O(matches) instead of a full scan.
+    """
+
+    def __init__(self, employees: List[Employee]):
+        self.employees = employees
+        self._by_name: Dict[str, Employee] = {}
+        self._by_team: Dict[Team, List[Employee]] = {team: [] for team in Team}
+        # Keyed by the skill's plain int bit, so a packed mask looks up directly
+        self._by_skill: Dict[int, List[Employee]] = defaultdict(list)
+        for emp in employees:
+            self._by_name[emp.name.casefold()] = emp
+            self._by_team[emp.team].append(emp)
+            for skill in emp.skills:
+                self._by_skill[skill._value_].append(emp)
+
+    def __len__(self) -> int:
+        return len(self.employees)
+
+    def __iter__(self) -> Iterator[Employee]:
+        return iter(self.employees)
+
+    def find_employee_by_name(self, name: str) -> Optional[Employee]:
+        """Find employee by name (case-insensitive)."""
+        return self._by_name.get(name.casefold())
+
+    def get_team_members(self, team: Team) -> List[Employee]:
+        """Get all employees from a specific team."""
+        return list(self._by_team.get(team, ()))
+
+    def team_groups(self) -> Iterator[Tuple[Team, List[Employee]]]:
+        """Yield (team, members) for every non-empty team, in Team order."""
+        return ((team, members) for team, members in self._by_team.items() if members)
+
+    def get_available_employees(self) -> List[Employee]:
+        """Get all available employees."""
+        return [emp for emp in self.employees if emp.available]
+
+    def find_experts(self, required_skills: List[Skill]) -> List[Employee]:
+        """Find employees with specific skills, in roster order."""
+        required_mask = skills_to_mask(required_skills)
+        if required_mask & (required_mask - 1) == 0:
+            # Zero or one bit: the posting list is already the answer
+            return list(self._by_skill.get(required_mask, ()))
+        # Merging several postings costs more than one scan over the masks
+        return [emp for emp in self.employees if emp.skills_mask & required_mask]
+
+
+# Roster records: (name, role, team, skills, personality_traits, quirks, location)
+_EMPLOYEE_DATA: Tuple[tuple, ...] = (
+    # Architecture Team
+    (
+        "Marcus Chen",
+        "Senior Architecture Lead",
+        Team.ARCHITECTURE,
+        (Skill.ARCHITECTURE, Skill.PYTHON, Skill.LEADERSHIP, Skill.CLOUD),
+        ("Strategic thinker", "Calm under pressure", "Mentoring"),
+        ("Uses transportation metaphors", "Has model trains in office"),
+        "Architecture Lead Office",
+    ),
+    # Frontend Team
+    (
+        "Sarah Williams",
+        "Frontend Team Lead",
+        Team.FRONTEND,
+        (Skill.TYPESCRIPT, Skill.REACT, Skill.JAVASCRIPT, Skill.LEADERSHIP),
+        ("Detail-oriented", "Type-safety advocate", "Perfectionist"),
+        ("Insists on proper TypeScript types", "Color-codes everything"),
+        "Frontend Team Pod",
+    ),
+    (
+        "Jake Morrison",
+        "Senior Frontend Developer",
+        Team.FRONTEND,
+        (Skill.REACT, Skill.JAVASCRIPT, Skill.UI),
+        ("Creative", "Fast coder", "UI enthusiast"),
+        ("Always has latest tech gadgets",),
+        "Frontend Team Pod",
+    ),
+    (
+        "Priya Patel",
+        "Frontend Developer",
+        Team.FRONTEND,
+        (Skill.REACT, Skill.TYPESCRIPT, Skill.DESIGN),
+        ("Thorough", "Team player", "Quick learner"),
+        ("Makes the best chai in the office",),
+        "Frontend Team Pod",
+    ),
+    (
+        "Tom Bradley",
+        "Frontend Developer",
+        Team.FRONTEND,
+        (Skill.JAVASCRIPT, Skill.REACT, Skill.TESTING),
+        ("Reliable", "Documentation lover", "Patient"),
+        ("Writes haikus in code comments",),
+        "Frontend Team Pod",
+    ),
+    (
+        "Lin Zhang",
+        "Junior Frontend Developer",
+        Team.FRONTEND,
+        (Skill.JAVASCRIPT, Skill.REACT),
+        ("Eager", "Curious", "Hardworking"),
+        ("Asks lots of questions", "Takes detailed notes"),
+        "Frontend Team Pod",
+    ),
+    # Backend Team
+    (
+        "Roberto Silva",
+        "Backend Team Lead",
+        Team.BACKEND,
+        (Skill.PYTHON, Skill.NODEJS, Skill.DATABASES, Skill.LEADERSHIP),
+        ("Bilingual", "Efficient", "Problem solver"),
+        ("Comments in English and Portuguese", "Loves Brazilian jazz"),
+        "Backend Team Pod",
+    ),
+    (
+        "Emma Chen",
+        "Senior Backend Developer",
+        Team.BACKEND,
+        (Skill.PYTHON, Skill.DATABASES, Skill.CLOUD),
+        ("Analytical", "Performance-focused", "Mentor"),
+        ("Optimizes everything", "Runs marathons"),
+        "Backend Team Pod",
+    ),
+    (
+        "David Park",
+        "Backend Developer",
+        Team.BACKEND,
+        (Skill.PYTHON, Skill.NODEJS, Skill.DATABASES),
+        ("Methodical", "Database expert", "Collaborative"),
+        ("Names all databases after Star Wars characters",),
+        "Backend Team Pod",
+    ),
+    # QA Department
+    (
+        "Jessica Park",
+        "QA Lead",
+        Team.QA,
+        (Skill.TESTING, Skill.PYTHON, Skill.LEADERSHIP),
+        ("Meticulous", "Quality-driven", "Diplomatic"),
+        ("Finds bugs in real life", "Has bug plushies on desk"),
+        "QA Testing Lab",
+    ),
+    (
+        "Ahmed Hassan",
+        "Senior QA Engineer",
+        Team.QA,
+        (Skill.TESTING, Skill.PYTHON, Skill.JAVASCRIPT),
+        ("Sharp-eyed", "Edge-case hunter", "Persistent"),
+        ("Finds obscure edge-case bugs", "Collects vintage keyboards"),
+        "QA Testing Lab",
+    ),
+    (
+        "Natasha Volkov",
+        "QA Engineer",
+        Team.QA,
+        (Skill.TESTING, Skill.PYTHON),
+        ("Thorough", "Automation advocate", "Patient"),
+        ("Automates everything possible", "Chess champion"),
+        "QA Testing Lab",
+    ),
+    # DevOps Team
+    (
+        "Kevin O'Brien",
+        "DevOps Lead",
+        Team.DEVOPS,
+        (Skill.DEVOPS, Skill.CLOUD, Skill.SECURITY, Skill.LEADERSHIP),
+        ("Cautious", "Reliability-focused", "Prepared"),
+        ("Backs up everything multiple times", "Has disaster recovery plans for lunch"),
+        "DevOps Pod",
+    ),
+    (
+        "Raj Kumar",
+        "DevOps Engineer",
+        Team.DEVOPS,
+        (Skill.DEVOPS, Skill.CLOUD, Skill.PYTHON),
+        ("Efficient", "Infrastructure expert", "Calm"),
+        ("Monitors uptime obsessively", "Meditates during deployments"),
+        "DevOps Pod",
+    ),
+    (
+        "Sofia Rodriguez",
+        "DevOps Engineer",
+        Team.DEVOPS,
+        (Skill.DEVOPS, Skill.CLOUD, Skill.SECURITY),
+        ("Proactive", "Security-minded", "Organized"),
+        ("Color-codes infrastructure", "Always has coffee"),
+        "DevOps Pod",
+    ),
+    # Product Management
+    (
+        "Diana Foster",
+        "Director of Product Management",
+        Team.PRODUCT,
+        (Skill.PROJECT_MANAGEMENT, Skill.LEADERSHIP, Skill.COMMUNICATION),
+        ("Strategic", "Customer-focused", "Diplomatic"),
+        ("Translates customer to technical", "Has perfect handwriting"),
+        "Product Director Office",
+    ),
+    (
+        "Ben Carter",
+        "Assistant Product Manager",
+        Team.PRODUCT,
+        (Skill.PROJECT_MANAGEMENT, Skill.COMMUNICATION),
+        ("Organized", "Detail-oriented", "Supportive"),
+        ("Loves spreadsheets", "Makes perfect meeting notes"),
+        "Product Director Office",
+    ),
+    (
+        "Michelle Torres",
+        "Product Manager",
+        Team.PRODUCT,
+        (Skill.PROJECT_MANAGEMENT, Skill.COMMUNICATION, Skill.DATA_ANALYSIS),
+        ("Data-driven", "User-focused", "Decisive"),
+        ("A/B tests everything", "Even her lunch choices"),
+        "Product Director Office",
+    ),
+    # Data Analytics
+    (
+        "Dr. James Liu",
+        "Lead Data Scientist",
+        Team.DATA,
+        (Skill.PYTHON, Skill.DATA_ANALYSIS, Skill.LEADERSHIP),
+        ("Analytical", "Academic", "Thorough"),
+        ("Cites papers in conversation", "Has three PhDs"),
+        "Data Analytics Suite",
+    ),
+    (
+        "Sandra Kim",
+        "Data Analyst",
+        Team.DATA,
+        (Skill.PYTHON, Skill.DATA_ANALYSIS),
+        ("Visual thinker", "Pattern recognizer", "Creative"),
+        ("Sees data visualizations in clouds", "Loves infographics"),
+        "Data Analytics Suite",
+    ),
+    (
+        "Carlos Mendoza",
+        "Data Engineer",
+        Team.DATA,
+        (Skill.PYTHON, Skill.DATABASES, Skill.DATA_ANALYSIS),
+        ("Pipeline expert", "Efficient", "Problem solver"),
+        ("Optimizes data pipelines in sleep", "Drums on desk"),
+        "Data Analytics Suite",
+    ),
+    # Customer Success
+    (
+        "Grace Thompson",
+        "Customer Success Manager",
+        Team.CUSTOMER_SUCCESS,
+        (Skill.COMMUNICATION, Skill.PROJECT_MANAGEMENT),
+        ("Empathetic", "Patient", "Solution-oriented"),
+        ("Never loses her cool", "Remembers everyone's birthday"),
+        "Reception",
+    ),
+    (
+        "Antoine Dubois",
+        "Customer Success Specialist",
+        Team.CUSTOMER_SUCCESS,
+        (Skill.COMMUNICATION,),
+        ("Multilingual", "Charming", "Detail-oriented"),
+        ("Speaks 5 languages", "Always has chocolates"),
+        "Reception",
+    ),
+    (
+        "Yuki Tanaka",
+        "Customer Success Specialist",
+        Team.CUSTOMER_SUCCESS,
+        (Skill.COMMUNICATION, Skill.TESTING),
+        ("Attentive", "Technical", "Friendly"),
+        ("Can explain anything simply", "Origami master"),
+        "Reception",
+    ),
+    # Executive
+    (
+        "Alexandra Morrison",
+        "Chief Technology Officer",
+        Team.EXECUTIVE,
+        (Skill.LEADERSHIP, Skill.ARCHITECTURE, Skill.PYTHON, Skill.COMMUNICATION),
+        ("Visionary", "Strategic", "Supportive"),
+        ("Built the first version of the product", "Codes on weekends"),
+        "CTO Office",
+    ),
+    # Security Team
+    (
+        "Dmitri Volkov",
+        "Security Engineer",
+        Team.SECURITY,
+        (Skill.SECURITY, Skill.PYTHON, Skill.CLOUD),
+        ("Vigilant", "Paranoid (in a good way)", "Thorough"),
+        ("Finds security issues everywhere", "Uses 50-character passwords"),
+        "Server Room",
+    ),
+    (
+        "Vanessa Wright",
+        "Security Engineer",
+        Team.SECURITY,
+        (Skill.SECURITY, Skill.PYTHON, Skill.TESTING),
+        ("Methodical", "Compliance-focused", "Detail-oriented"),
+        ("Reads security bulletins for fun", "Penetration testing enthusiast"),
+        "Server Room",
+    ),
+    # Design Team
+    (
+        "Paulo Santos",
+        "Creative Director",
+        Team.DESIGN,
+        (Skill.DESIGN, Skill.UI, Skill.UX, Skill.LEADERSHIP),
+        ("Creative", "User-focused", "Inspiring"),
+        ("Sketches constantly", "Talks about color theory"),
+        "Design Studio",
+    ),
+    (
+        "Katie Lin",
+        "UI Designer",
+        Team.DESIGN,
+        (Skill.UI, Skill.DESIGN),
+        ("Pixel-perfect", "Modern aesthetics", "Collaborative"),
+        ("Can spot 1px misalignment", "Has Pantone color deck"),
+        "Design Studio",
+    ),
+    (
+        "Amit Shah",
+        "UX Designer",
+        Team.DESIGN,
+        (Skill.UX, Skill.DESIGN, Skill.COMMUNICATION),
+        ("User advocate", "Research-driven", "Empathetic"),
+        ("Interviews strangers for user research", "Wireframe enthusiast"),
+        "Design Studio",
+    ),
+    # Intern - The Joker Character
+    (
+        "Bobby Chen",
+        "Software Engineering Intern (The Creative Wildcard)",
+        Team.INTERN,
+        (Skill.PYTHON, Skill.JAVASCRIPT, Skill.DATABASES, Skill.TESTING),
+        (
+            "Enthusiastic",
+            "Eager to learn",
+            "Growing rapidly",
+            "Creative problem-solver",
+            "Learns from mistakes"
+        ),
+        (
+            "Former production database deleter (never again!)",
+            "Asks surprisingly insightful architecture questions",
+            "Has local Docker test environment to avoid breaking things",
+            "Takes extensive notes on everything",
+            "Suggests features that seniors forgot to consider",
+            "The lovable chaos agent who keeps the team humble",
+            "Reading documentation voraciously",
+            "Thinks about edge cases and UX details"
+        ),
+        "Corner Desk (with extra monitors and sticky notes everywhere)",
+    ),
+    # Additional team members to reach 47
+    ("Rachel Green", "Frontend Developer", Team.FRONTEND, (Skill.REACT, Skill.JAVASCRIPT),
+     ("Professional", "Reliable"), (), "Frontend Team Pod"),
+    ("Michael Scott", "Product Manager", Team.PRODUCT, (Skill.PROJECT_MANAGEMENT, Skill.COMMUNICATION),
+     ("Professional", "Reliable"), (), "Product Director Office"),
+    ("Dwight Schrute", "Security Analyst", Team.SECURITY, (Skill.SECURITY, Skill.TESTING),
+     ("Professional", "Reliable"), (), "Server Room"),
+    ("Jim Halpert", "Backend Developer", Team.BACKEND, (Skill.PYTHON, Skill.DATABASES),
+     ("Professional", "Reliable"), (), "Backend Team Pod"),
+    ("Pam Beesly", "UX Researcher", Team.DESIGN, (Skill.UX, Skill.COMMUNICATION),
+     ("Professional", "Reliable"), (), "Design Studio"),
+    ("Stanley Hudson", "Senior Backend Engineer", Team.BACKEND, (Skill.PYTHON, Skill.DATABASES),
+     ("Professional", "Reliable"), (), "Backend Team Pod"),
+    ("Phyllis Vance", "Customer Success Manager", Team.CUSTOMER_SUCCESS, (Skill.COMMUNICATION,),
+     ("Professional", "Reliable"), (), "Reception"),
+    ("Angela Martin", "QA Engineer", Team.QA, (Skill.TESTING, Skill.PYTHON),
+     ("Professional", "Reliable"), (), "QA Testing Lab"),
+    ("Oscar Martinez", "Data Analyst", Team.DATA, (Skill.DATA_ANALYSIS, Skill.PYTHON),
+     ("Professional", "Reliable"), (), "Data Analytics Suite"),
+    ("Kevin Malone", "Backend Developer", Team.BACKEND, (Skill.PYTHON, Skill.DATABASES),
+     ("Professional", "Reliable"), (), "Backend Team Pod"),
+    ("Meredith Palmer", "DevOps Engineer", Team.DEVOPS, (Skill.DEVOPS, Skill.CLOUD),
+     ("Professional", "Reliable"), (), "DevOps Pod"),
+    ("Creed Bratton", "Quality Assurance", Team.QA, (Skill.TESTING,),
+     ("Professional", "Reliable"), (), "QA Testing Lab"),
+    ("Ryan Howard", "Product Analyst", Team.PRODUCT, (Skill.PROJECT_MANAGEMENT, Skill.DATA_ANALYSIS),
+     ("Professional", "Reliable"), (), "Product Director Office"),
+    ("Kelly Kapoor", "Customer Success Specialist", Team.CUSTOMER_SUCCESS, (Skill.COMMUNICATION,),
+     ("Professional", "Reliable"), (), "Reception"),
+    ("Toby Flenderson", "Compliance Officer", Team.SECURITY, (Skill.SECURITY,),
+     ("Professional", "Reliable"), (), "Server Room"),
+    ("Darryl Philbin", "DevOps Engineer", Team.DEVOPS, (Skill.DEVOPS, Skill.LEADERSHIP),
+     ("Professional", "Reliable"), (), "DevOps Pod"),
+)
+
+
+def _build_all_employees() -> List[Employee]:
+    """Construct all 47 employees from the roster records."""
+    return [
+        Employee(name, role, team, skills, personality_traits, quirks, location=location)
+        for name, role, team, skills, personality_traits, quirks, location in _EMPLOYEE_DATA
+    ]
 
 
 class EmployeeFactory:
@@ -103,379 +583,35 @@ class EmployeeFactory:
 
     @staticmethod
     def create_all_employees() -> List[Employee]:
-        """Create and return all 47 employees."""
+        """
+        Return all 47 employees.
+        The roster is built once at import; each call hands out fresh copies
+        so one office's task assignments never leak into another's.
+        """
+        # Fill the slots directly: copy.copy goes through __reduce_ex__ and is
+        # slower than rebuilding. Keep in step with Employee's fields.
         employees = []
-
-        # Architecture Team
-        employees.append(Employee(
-            name="Marcus Chen",
-            role="Senior Architecture Lead",
-            team=Team.ARCHITECTURE,
-            skills=[Skill.ARCHITECTURE, Skill.PYTHON, Skill.LEADERSHIP, Skill.CLOUD],
-            personality_traits=["Strategic thinker", "Calm under pressure", "Mentoring"],
-            quirks=["Uses transportation metaphors", "Has model trains in office"],
-            location="Architecture Lead Office"
-        ))
-
-        # Frontend Team
-        employees.append(Employee(
-            name="Sarah Williams",
-            role="Frontend Team Lead",
-            team=Team.FRONTEND,
-            skills=[Skill.TYPESCRIPT, Skill.REACT, Skill.JAVASCRIPT, Skill.LEADERSHIP],
-            personality_traits=["Detail-oriented", "Type-safety advocate", "Perfectionist"],
-            quirks=["Insists on proper TypeScript types", "Color-codes everything"],
-            location="Frontend Team Pod"
-        ))
-
-        employees.append(Employee(
-            name="Jake Morrison",
-            role="Senior Frontend Developer",
-            team=Team.FRONTEND,
-            skills=[Skill.REACT, Skill.JAVASCRIPT, Skill.UI],
-            personality_traits=["Creative", "Fast coder", "UI enthusiast"],
-            quirks=["Always has latest tech gadgets"],
-            location="Frontend Team Pod"
-        ))
-
-        employees.append(Employee(
-            name="Priya Patel",
-            role="Frontend Developer",
-            team=Team.FRONTEND,
-            skills=[Skill.REACT, Skill.TYPESCRIPT, Skill.DESIGN],
-            personality_traits=["Thorough", "Team player", "Quick learner"],
-            quirks=["Makes the best chai in the office"],
-            location="Frontend Team Pod"
-        ))
-
-        employees.append(Employee(
-            name="Tom Bradley",
-            role="Frontend Developer",
-            team=Team.FRONTEND,
-            skills=[Skill.JAVASCRIPT, Skill.REACT, Skill.TESTING],
-            personality_traits=["Reliable", "Documentation lover", "Patient"],
-            quirks=["Writes haikus in code comments"],
-            location="Frontend Team Pod"
-        ))
-
-        employees.append(Employee(
-            name="Lin Zhang",
-            role="Junior Frontend Developer",
-            team=Team.FRONTEND,
-            skills=[Skill.JAVASCRIPT, Skill.REACT],
-            personality_traits=["Eager", "Curious", "Hardworking"],
-            quirks=["Asks lots of questions", "Takes detailed notes"],
-            location="Frontend Team Pod"
-        ))
-
-        # Backend Team
-        employees.append(Employee(
-            name="Roberto Silva",
-            role="Backend Team Lead",
-            team=Team.BACKEND,
-            skills=[Skill.PYTHON, Skill.NODEJS, Skill.DATABASES, Skill.LEADERSHIP],
-            personality_traits=["Bilingual", "Efficient", "Problem solver"],
-            quirks=["Comments in English and Portuguese", "Loves Brazilian jazz"],
-            location="Backend Team Pod"
-        ))
-
-        employees.append(Employee(
-            name="Emma Chen",
-            role="Senior Backend Developer",
-            team=Team.BACKEND,
-            skills=[Skill.PYTHON, Skill.DATABASES, Skill.CLOUD],
-            personality_traits=["Analytical", "Performance-focused", "Mentor"],
-            quirks=["Optimizes everything", "Runs marathons"],
-            location="Backend Team Pod"
-        ))
-
-        employees.append(Employee(
-            name="David Park",
-            role="Backend Developer",
-            team=Team.BACKEND,
-            skills=[Skill.PYTHON, Skill.NODEJS, Skill.DATABASES],
-            personality_traits=["Methodical", "Database expert", "Collaborative"],
-            quirks=["Names all databases after Star Wars characters"],
-            location="Backend Team Pod"
-        ))
-
-        # QA Department
-        employees.append(Employee(
-            name="Jessica Park",
-            role="QA Lead",
-            team=Team.QA,
-            skills=[Skill.TESTING, Skill.PYTHON, Skill.LEADERSHIP],
-            personality_traits=["Meticulous", "Quality-driven", "Diplomatic"],
-            quirks=["Finds bugs in real life", "Has bug plushies on desk"],
-            location="QA Testing Lab"
-        ))
-
-        employees.append(Employee(
-            name="Ahmed Hassan",
-            role="Senior QA Engineer",
-            team=Team.QA,
-            skills=[Skill.TESTING, Skill.PYTHON, Skill.JAVASCRIPT],
-            personality_traits=["Sharp-eyed", "Edge-case hunter", "Persistent"],
-            quirks=["Finds obscure edge-case bugs", "Collects vintage keyboards"],
-            location="QA Testing Lab"
-        ))
-
-        employees.append(Employee(
-            name="Natasha Volkov",
-            role="QA Engineer",
-            team=Team.QA,
-            skills=[Skill.TESTING, Skill.PYTHON],
-            personality_traits=["Thorough", "Automation advocate", "Patient"],
-            quirks=["Automates everything possible", "Chess champion"],
-            location="QA Testing Lab"
-        ))
-
-        # DevOps Team
-        employees.append(Employee(
-            name="Kevin O'Brien",
-            role="DevOps Lead",
-            team=Team.DEVOPS,
-            skills=[Skill.DEVOPS, Skill.CLOUD, Skill.SECURITY, Skill.LEADERSHIP],
-            personality_traits=["Cautious", "Reliability-focused", "Prepared"],
-            quirks=["Backs up everything multiple times", "Has disaster recovery plans for lunch"],
-            location="DevOps Pod"
-        ))
-
-        employees.append(Employee(
-            name="Raj Kumar",
-            role="DevOps Engineer",
-            team=Team.DEVOPS,
-            skills=[Skill.DEVOPS, Skill.CLOUD, Skill.PYTHON],
-            personality_traits=["Efficient", "Infrastructure expert", "Calm"],
-            quirks=["Monitors uptime obsessively", "Meditates during deployments"],
-            location="DevOps Pod"
-        ))
-
-        employees.append(Employee(
-            name="Sofia Rodriguez",
-            role="DevOps Engineer",
-            team=Team.DEVOPS,
-            skills=[Skill.DEVOPS, Skill.CLOUD, Skill.SECURITY],
-            personality_traits=["Proactive", "Security-minded", "Organized"],
-            quirks=["Color-codes infrastructure", "Always has coffee"],
-            location="DevOps Pod"
-        ))
-
-        # Product Management
-        employees.append(Employee(
-            name="Diana Foster",
-            role="Director of Product Management",
-            team=Team.PRODUCT,
-            skills=[Skill.PROJECT_MANAGEMENT, Skill.LEADERSHIP, Skill.COMMUNICATION],
-            personality_traits=["Strategic", "Customer-focused", "Diplomatic"],
-            quirks=["Translates customer to technical", "Has perfect handwriting"],
-            location="Product Director Office"
-        ))
-
-        employees.append(Employee(
-            name="Ben Carter",
-            role="Assistant Product Manager",
-            team=Team.PRODUCT,
-            skills=[Skill.PROJECT_MANAGEMENT, Skill.COMMUNICATION],
-            personality_traits=["Organized", "Detail-oriented", "Supportive"],
-            quirks=["Loves spreadsheets", "Makes perfect meeting notes"],
-            location="Product Director Office"
-        ))
-
-        employees.append(Employee(
-            name="Michelle Torres",
-            role="Product Manager",
-            team=Team.PRODUCT,
-            skills=[Skill.PROJECT_MANAGEMENT, Skill.COMMUNICATION, Skill.DATA_ANALYSIS],
-            personality_traits=["Data-driven", "User-focused", "Decisive"],
-            quirks=["A/B tests everything", "Even her lunch choices"],
-            location="Product Director Office"
-        ))
-
-        # Data Analytics
-        employees.append(Employee(
-            name="Dr. James Liu",
-            role="Lead Data Scientist",
-            team=Team.DATA,
-            skills=[Skill.PYTHON, Skill.DATA_ANALYSIS, Skill.LEADERSHIP],
-            personality_traits=["Analytical", "Academic", "Thorough"],
-            quirks=["Cites papers in conversation", "Has three PhDs"],
-            location="Data Analytics Suite"
-        ))
-
-        employees.append(Employee(
-            name="Sandra Kim",
-            role="Data Analyst",
-            team=Team.DATA,
-            skills=[Skill.PYTHON, Skill.DATA_ANALYSIS],
-            personality_traits=["Visual thinker", "Pattern recognizer", "Creative"],
-            quirks=["Sees data visualizations in clouds", "Loves infographics"],
-            location="Data Analytics Suite"
-        ))
-
-        employees.append(Employee(
-            name="Carlos Mendoza",
-            role="Data Engineer",
-            team=Team.DATA,
-            skills=[Skill.PYTHON, Skill.DATABASES, Skill.DATA_ANALYSIS],
-            personality_traits=["Pipeline expert", "Efficient", "Problem solver"],
-            quirks=["Optimizes data pipelines in sleep", "Drums on desk"],
-            location="Data Analytics Suite"
-        ))
-
-        # Customer Success
-        employees.append(Employee(
-            name="Grace Thompson",
-            role="Customer Success Manager",
-            team=Team.CUSTOMER_SUCCESS,
-            skills=[Skill.COMMUNICATION, Skill.PROJECT_MANAGEMENT],
-            personality_traits=["Empathetic", "Patient", "Solution-oriented"],
-            quirks=["Never loses her cool", "Remembers everyone's birthday"],
-            location="Reception"
-        ))
-
-        employees.append(Employee(
-            name="Antoine Dubois",
-            role="Customer Success Specialist",
-            team=Team.CUSTOMER_SUCCESS,
-            skills=[Skill.COMMUNICATION],
-            personality_traits=["Multilingual", "Charming", "Detail-oriented"],
-            quirks=["Speaks 5 languages", "Always has chocolates"],
-            location="Reception"
-        ))
-
-        employees.append(Employee(
-            name="Yuki Tanaka",
-            role="Customer Success Specialist",
-            team=Team.CUSTOMER_SUCCESS,
-            skills=[Skill.COMMUNICATION, Skill.TESTING],
-            personality_traits=["Attentive", "Technical", "Friendly"],
-            quirks=["Can explain anything simply", "Origami master"],
-            location="Reception"
-        ))
-
-        # Executive
-        employees.append(Employee(
-            name="Alexandra Morrison",
-            role="Chief Technology Officer",
-            team=Team.EXECUTIVE,
-            skills=[Skill.LEADERSHIP, Skill.ARCHITECTURE, Skill.PYTHON, Skill.COMMUNICATION],
-            personality_traits=["Visionary", "Strategic", "Supportive"],
-            quirks=["Built the first version of the product", "Codes on weekends"],
-            location="CTO Office"
-        ))
-
-        # Security Team
-        employees.append(Employee(
-            name="Dmitri Volkov",
-            role="Security Engineer",
-            team=Team.SECURITY,
-            skills=[Skill.SECURITY, Skill.PYTHON, Skill.CLOUD],
-            personality_traits=["Vigilant", "Paranoid (in a good way)", "Thorough"],
-            quirks=["Finds security issues everywhere", "Uses 50-character passwords"],
-            location="Server Room"
-        ))
-
-        employees.append(Employee(
-            name="Vanessa Wright",
-            role="Security Engineer",
-            team=Team.SECURITY,
-            skills=[Skill.SECURITY, Skill.PYTHON, Skill.TESTING],
-            personality_traits=["Methodical", "Compliance-focused", "Detail-oriented"],
-            quirks=["Reads security bulletins for fun", "Penetration testing enthusiast"],
-            location="Server Room"
-        ))
-
-        # Design Team
-        employees.append(Employee(
-            name="Paulo Santos",
-            role="Creative Director",
-            team=Team.DESIGN,
-            skills=[Skill.DESIGN, Skill.UI, Skill.UX, Skill.LEADERSHIP],
-            personality_traits=["Creative", "User-focused", "Inspiring"],
-            quirks=["Sketches constantly", "Talks about color theory"],
-            location="Design Studio"
-        ))
-
-        employees.append(Employee(
-            name="Katie Lin",
-            role="UI Designer",
-            team=Team.DESIGN,
-            skills=[Skill.UI, Skill.DESIGN],
-            personality_traits=["Pixel-perfect", "Modern aesthetics", "Collaborative"],
-            quirks=["Can spot 1px misalignment", "Has Pantone color deck"],
-            location="Design Studio"
-        ))
-
-        employees.append(Employee(
-            name="Amit Shah",
-            role="UX Designer",
-            team=Team.DESIGN,
-            skills=[Skill.UX, Skill.DESIGN, Skill.COMMUNICATION],
-            personality_traits=["User advocate", "Research-driven", "Empathetic"],
-            quirks=["Interviews strangers for user research", "Wireframe enthusiast"],
-            location="Design Studio"
-        ))
-
-        # Intern - The Joker Character
-        employees.append(Employee(
-            name="Bobby Chen",
-            role="Software Engineering Intern (The Creative Wildcard)",
-            team=Team.INTERN,
-            skills=[Skill.PYTHON, Skill.JAVASCRIPT, Skill.DATABASES, Skill.TESTING],
-            personality_traits=[
-                "Enthusiastic",
-                "Eager to learn",
-                "Growing rapidly",
-                "Creative problem-solver",
-                "Learns from mistakes"
-            ],
-            quirks=[
-                "Former production database deleter (never again!)",
-                "Asks surprisingly insightful architecture questions",
-                "Has local Docker test environment to avoid breaking things",
-                "Takes extensive notes on everything",
-                "Suggests features that seniors forgot to consider",
-                "The lovable chaos agent who keeps the team humble",
-                "Reading documentation voraciously",
-                "Thinks about edge cases and UX details"
-            ],
-            location="Corner Desk (with extra monitors and sticky notes everywhere)"
-        ))
-
-        # Additional team members to reach 47
-        additional_employees = [
-            ("Rachel Green", "Frontend Developer", Team.FRONTEND, [Skill.REACT, Skill.JAVASCRIPT], "Frontend Team Pod"),
-            ("Michael Scott", "Product Manager", Team.PRODUCT, [Skill.PROJECT_MANAGEMENT, Skill.COMMUNICATION], "Product Director Office"),
-            ("Dwight Schrute", "Security Analyst", Team.SECURITY, [Skill.SECURITY, Skill.TESTING], "Server Room"),
-            ("Jim Halpert", "Backend Developer", Team.BACKEND, [Skill.PYTHON, Skill.DATABASES], "Backend Team Pod"),
-            ("Pam Beesly", "UX Researcher", Team.DESIGN, [Skill.UX, Skill.COMMUNICATION], "Design Studio"),
-            ("Stanley Hudson", "Senior Backend Engineer", Team.BACKEND, [Skill.PYTHON, Skill.DATABASES], "Backend Team Pod"),
-            ("Phyllis Vance", "Customer Success Manager", Team.CUSTOMER_SUCCESS, [Skill.COMMUNICATION], "Reception"),
-            ("Angela Martin", "QA Engineer", Team.QA, [Skill.TESTING, Skill.PYTHON], "QA Testing Lab"),
-            ("Oscar Martinez", "Data Analyst", Team.DATA, [Skill.DATA_ANALYSIS, Skill.PYTHON], "Data Analytics Suite"),
-            ("Kevin Malone", "Backend Developer", Team.BACKEND, [Skill.PYTHON, Skill.DATABASES], "Backend Team Pod"),
-            ("Meredith Palmer", "DevOps Engineer", Team.DEVOPS, [Skill.DEVOPS, Skill.CLOUD], "DevOps Pod"),
-            ("Creed Bratton", "Quality Assurance", Team.QA, [Skill.TESTING], "QA Testing Lab"),
-            ("Ryan Howard", "Product Analyst", Team.PRODUCT, [Skill.PROJECT_MANAGEMENT, Skill.DATA_ANALYSIS], "Product Director Office"),
-            ("Kelly Kapoor", "Customer Success Specialist", Team.CUSTOMER_SUCCESS, [Skill.COMMUNICATION], "Reception"),
-            ("Toby Flenderson", "Compliance Officer", Team.SECURITY, [Skill.SECURITY], "Server Room"),
-            ("Darryl Philbin", "DevOps Engineer", Team.DEVOPS, [Skill.DEVOPS, Skill.LEADERSHIP], "DevOps Pod"),
-        ]
-
-        for name, role, team, skills, location in additional_employees:
-            employees.append(Employee(
-                name=name,
-                role=role,
-                team=team,
-                skills=skills,
-                personality_traits=["Professional", "Reliable"],
-                quirks=[],
-                location=location
-            ))
-
+        for emp in _ALL_EMPLOYEES:
+            clone = _new_employee(Employee)
+            clone.name = emp.name
+            clone.role = emp.role
+            clone.team = emp.team
+            clone.skills = emp.skills
+            clone.personality_traits = emp.personality_traits
+            clone.quirks = emp.quirks
+            clone.current_task = None
+            clone.location = emp.location
+            clone.available = True
+            clone.skills_mask = emp.skills_mask
+            clone.skill_labels = emp.skill_labels
+            employees.append(clone)
         return employees
 
+    @staticmethod
+    def create_registry() -> EmployeeRegistry:
+        """Create all 47 employees wrapped in an indexed registry."""
+        return EmployeeRegistry(EmployeeFactory.create_all_employees())
+
     @staticmethod
     def find_employee_by_name(employees: List[Employee], name: str) -> Optional[Employee]:
         """Find employee by name."""
@@ -497,7 +633,30 @@ class EmployeeFactory:
     @staticmethod
     def find_experts(employees: List[Employee], required_skills: List[Skill]) -> List[Employee]:
         """Find employees with specific skills."""
-        return [emp for emp in employees if emp.can_help_with(required_skills)]
+        required_mask = skills_to_mask(required_skills)
+        return [emp for emp in employees if emp.skills_mask & required_mask]
+
+    @staticmethod
+    def find_available_experts(employees: List[Employee],
+                               required_skills: List[Skill]) -> List[Employee]:
+        """Find available employees with any of the skills, in one pass."""
+        required_mask = skills_to_mask(required_skills)
+        return [emp for emp in employees if emp.available and emp.skills_mask & required_mask]
+
+    @staticmethod
+    def first_available_with_skill(employees: List[Employee],
+                                   required_skills: List[Skill]) -> Optional[Employee]:
+        """Find the first available employee with any of the skills, or None."""
+        required_mask = skills_to_mask(required_skills)
+        return next(
+            (emp for emp in employees if emp.available and emp.skills_mask & required_mask),
+            None
+        )
+
+
+# Built once at import: the roster is fixed, only per-office state changes
+_new_employee = object.__new__
+_ALL_EMPLOYEES: Tuple[Employee, ...] = tuple(_build_all_employees())
 
 
 if __name__ == "__main__":
@@ -507,7 +666,8 @@ if __name__ == "__main__":
 
     print(f"\n🏢 Created {len(all_employees)} employees")
     print("\nTeam breakdown:")
+    team_counts = Counter(emp.team for emp in all_employees)
     for team in Team:
-        count = len(factory.get_team_members(all_employees, team))
+        count = team_counts[team]
         if count > 0:
-            print(f"  • {team.value}: {count} members")
+            print(f"  • {team.label}: {count} members")
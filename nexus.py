@@ -10,17 +10,26 @@ Coordinates office, employees, and project management.
 """
 
 import sys
-import os
-
-# Add the current directory to Python path for imports
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-
 from typing import List, Dict, Optional
-from office_builder import OfficeBuilder, Room
-from employees import Employee, EmployeeFactory, Team, Skill
+from itertools import islice
+from office_builder import OfficeBuilder, Room, CONFERENCE_ROOMS, TEAM_PODS, PRIVATE_OFFICES
+from employees import Employee, EmployeeFactory, EmployeeRegistry, Team, Skill, skills_to_mask
 from utils.display import Display
 
 
+# Stops on the office tour: (room name, description)
+_TOUR_STOPS = (
+    ("Reception", "The welcoming entrance with marble desk and comfortable seating"),
+    ("Frontend Team Pod", "Where Sarah's team crafts beautiful user interfaces"),
+    ("Backend Team Pod", "Roberto and team building robust server architecture"),
+    ("QA Testing Lab", "Jessica's domain - where bugs come to die"),
+    ("DevOps Pod", "Kevin's command center - keeping everything running smoothly"),
+    ("Design Studio", "Paulo's creative space with color-calibrated monitors"),
+    ("The War Room", "For intense planning sessions and critical decisions"),
+    ("Kitchen", "Coffee machines, espresso bar, and snacks - the true heart of any tech company"),
+)
+
+
 class NexusOffice:
     """
     Main simulation engine for Nexus Software Solutions.
@@ -31,6 +40,8 @@ class NexusOffice:
         self.display = Display()
         self.office_builder: Optional[OfficeBuilder] = None
         self.employees: List[Employee] = []
+        self.registry = EmployeeRegistry(self.employees)
+        self._expert_cache: Dict[int, List[Employee]] = {}
         self.initialized = False
         self.projects_completed = 0
 
@@ -53,6 +64,8 @@ class NexusOffice:
         print("\n  👥 Hiring and onboarding employees...")
         factory = EmployeeFactory()
         self.employees = factory.create_all_employees()
+        self.registry = EmployeeRegistry(self.employees)
+        self._expert_cache.clear()
 
         # Step 3: Assign employees to rooms
         self.display.info("\nPHASE 3: Workspace Assignment")
@@ -76,22 +89,20 @@ class NexusOffice:
 
     def _display_initialization_summary(self) -> None:
         """Display summary after initialization."""
-        available = len([e for e in self.employees if e.available])
+        available = sum(1 for e in self.employees if e.available)
         busy = len(self.employees) - available
 
         self.display.office_status(len(self.employees), available, busy)
 
         print(f"\n{Display.BOLD}🏢 Office Layout:{Display.RESET}")
         print(f"  • Total Rooms: {len(self.office_builder.rooms)}")
-        print(f"  • Conference Rooms: 4")
-        print(f"  • Team Pods: 6")
-        print(f"  • Private Offices: 3")
+        print(f"  • Conference Rooms: {len(self.office_builder.get_category_rooms(CONFERENCE_ROOMS))}")
+        print(f"  • Team Pods: {len(self.office_builder.get_category_rooms(TEAM_PODS))}")
+        print(f"  • Private Offices: {len(self.office_builder.get_category_rooms(PRIVATE_OFFICES))}")
 
         print(f"\n{Display.BOLD}👥 Team Composition:{Display.RESET}")
-        for team in Team:
-            team_members = EmployeeFactory.get_team_members(self.employees, team)
-            if team_members:
-                print(f"  • {team.value:25} {len(team_members):2} members")
+        for team, team_members in self.registry.team_groups():
+            print(f"  • {team.label:25} {len(team_members):2} members")
 
         self.display.separator()
         self.display.success("All systems operational. Ready for customer projects!")
@@ -99,11 +110,11 @@ class NexusOffice:
 
     def get_employee(self, name: str) -> Optional[Employee]:
         """Get employee by name."""
-        return EmployeeFactory.find_employee_by_name(self.employees, name)
+        return self.registry.find_employee_by_name(name)
 
     def get_team(self, team: Team) -> List[Employee]:
         """Get all members of a specific team."""
-        return EmployeeFactory.get_team_members(self.employees, team)
+        return self.registry.get_team_members(team)
 
     def get_available_employees(self) -> List[Employee]:
         """Get all available employees."""
@@ -111,7 +122,18 @@ class NexusOffice:
 
     def find_experts(self, skills: List[Skill]) -> List[Employee]:
         """Find employees with specific skills."""
-        return EmployeeFactory.find_experts(self.employees, skills)
+        # Skills never change after hiring, so results are cached per skill set
+        key = skills_to_mask(skills)
+        experts = self._expert_cache.get(key)
+        if experts is None:
+            experts = self.registry.find_experts(key)
+            self._expert_cache[key] = experts
+        return list(experts)
+
+    def find_available_experts(self, skills: List[Skill]) -> List[Employee]:
+        """Find employees with specific skills who are free to take work."""
+        # Availability changes as tasks come and go, so this is never cached
+        return EmployeeFactory.find_available_experts(self.employees, skills)
 
     def show_office_layout(self) -> None:
         """Display the office layout."""
@@ -128,10 +150,8 @@ class NexusOffice:
 
         self.display.header("EMPLOYEE DIRECTORY")
 
-        for team in Team:
-            team_members = self.get_team(team)
-            if team_members:
-                self.display.team_roster(team.value, team_members)
+        for team, team_members in self.registry.team_groups():
+            self.display.team_roster(team.label, team_members)
 
         print()
 
@@ -142,7 +162,7 @@ class NexusOffice:
             return
 
         team_members = self.get_team(team)
-        self.display.header(f"{team.value.upper()} TEAM")
+        self.display.header(f"{team.label.upper()} TEAM")
 
         for employee in team_members:
             self.display.employee_card(employee)
@@ -180,28 +200,19 @@ class NexusOffice:
         self.display.header("OFFICE TOUR")
         self.display.narration("*Walking through the glass doors onto the 14th floor*")
 
-        tour_stops = [
-            ("Reception", "The welcoming entrance with marble desk and comfortable seating"),
-            ("Frontend Team Pod", "Where Sarah's team crafts beautiful user interfaces"),
-            ("Backend Team Pod", "Roberto and team building robust server architecture"),
-            ("QA Testing Lab", "Jessica's domain - where bugs come to die"),
-            ("DevOps Pod", "Kevin's command center - keeping everything running smoothly"),
-            ("Design Studio", "Paulo's creative space with color-calibrated monitors"),
-            ("The War Room", "For intense planning sessions and critical decisions"),
-            ("Kitchen", "Coffee machines, espresso bar, and snacks - the true heart of any tech company"),
-        ]
-
-        for room_name, description in tour_stops:
+        lines = []
+        for room_name, description in _TOUR_STOPS:
             room = self.office_builder.get_room(room_name)
             if room:
-                print(f"\n{Display.BOLD}📍 {room_name}{Display.RESET}")
-                print(f"   {description}")
+                lines.append(f"\n{Display.BOLD}📍 {room_name}{Display.RESET}")
+                lines.append(f"   {description}")
                 if room.occupied_by:
-                    print(f"   Currently here: {', '.join(room.occupied_by[:3])}", end="")
-                    if len(room.occupied_by) > 3:
-                        print(f" and {len(room.occupied_by) - 3} others")
-                    else:
-                        print()
+                    here = f"   Currently here: {', '.join(islice(room.occupied_by, 3))}"
+                    if room.occupied_count > 3:
+                        here += f" and {room.occupied_count - 3} others"
+                    lines.append(here)
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
 
         self.display.separator()
         self.display.narration("*Tour complete. Floor-to-ceiling windows offer stunning city views*")
@@ -215,7 +226,7 @@ class NexusOffice:
                 "message": "Office not initialized"
             }
 
-        available = len(self.get_available_employees())
+        available = sum(1 for e in self.employees if e.available)
         busy = len(self.employees) - available
 
         return {
@@ -244,9 +255,12 @@ class NexusOffice:
 
         war_room = self.office_builder.get_room("The War Room")
         if war_room:
-            print(f"\n{Display.BOLD}The War Room - All Hands Meeting{Display.RESET}")
-            print(f"  Capacity: {war_room.capacity} (Currently packed with {len(self.employees)} people)")
-            print(f"  Topic: {Display.YELLOW}{topic}{Display.RESET}")
+            print(
+                f"\n{Display.BOLD}The War Room - All Hands Meeting{Display.RESET}",
+                f"  Capacity: {war_room.capacity} (Currently packed with {len(self.employees)} people)",
+                f"  Topic: {Display.YELLOW}{topic}{Display.RESET}",
+                sep="\n"
+            )
 
         print()
 
@@ -8,22 +8,37 @@ Office Builder Module
 Constructs the Nexus Software Solutions office environment on the 14th floor.
 """
 
-from typing import Dict, List
-from dataclasses import dataclass
-from datetime import datetime
+from typing import Dict, List, Set, Tuple
+from dataclasses import dataclass, field
+from itertools import islice
+import sys
+import time
 
+# Section rules used by the construction and layout output
+_RULE = "=" * 70
+_THIN_RULE = "-" * 70
 
-@dataclass
+# Layout categories, in display order
+RECEPTION_AREA = "🚪 RECEPTION"
+CONFERENCE_ROOMS = "🤝 CONFERENCE ROOMS"
+TEAM_PODS = "💻 TEAM PODS"
+PRIVATE_OFFICES = "👔 PRIVATE OFFICES"
+COMMON_AREAS = "☕ COMMON AREAS"
+
+
+@dataclass(slots=True)
 class Room:
     """Represents a room in the office."""
     name: str
     capacity: int
     amenities: List[str]
-    occupied_by: List[str] = None
+    occupied_by: List[str] = field(default_factory=list)
+    occupied_count: int = field(init=False, default=0)
+    occupied_set: Set[str] = field(init=False, default_factory=set)
 
     def __post_init__(self):
-        if self.occupied_by is None:
-            self.occupied_by = []
+        self.occupied_count = len(self.occupied_by)
+        self.occupied_set = set(self.occupied_by)
 
     def __repr__(self) -> str:
         return f"Room({self.name}, capacity={self.capacity})"
@@ -38,24 +53,37 @@ class OfficeBuilder:
     def __init__(self):
         self.floor_number = 14
         self.rooms: Dict[str, Room] = {}
-        self.common_areas: List[str] = []
         self.built = False
         self.construction_log: List[str] = []
+        self.total_capacity = 0
+        self._categories: Dict[str, List[str]] = {
+            RECEPTION_AREA: [],
+            CONFERENCE_ROOMS: [],
+            TEAM_PODS: [],
+            PRIVATE_OFFICES: [],
+            COMMON_AREAS: [],
+        }
 
     def log(self, message: str) -> None:
         """Log construction progress."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
+        log_entry = f"[{time.strftime('%H:%M:%S')}] {message}"
         self.construction_log.append(log_entry)
         print(f"  🔨 {message}")
 
+    def _add_room(self, name: str, capacity: int, amenities: List[str], category: str) -> None:
+        """Add a room and record it in its layout category and the capacity total."""
+        self.rooms[name] = Room(name=name, capacity=capacity, amenities=amenities)
+        self.total_capacity += capacity
+        self._categories[category].append(name)
+
     def build_reception(self) -> None:
         """Build the reception area."""
         self.log("Building reception area with marble desk...")
-        self.rooms["Reception"] = Room(
-            name="Reception",
-            capacity=5,
-            amenities=["Marble Desk", "Visitor Seating", "Company Logo Wall", "Coffee Station"]
+        self._add_room(
+            "Reception",
+            5,
+            ["Marble Desk", "Visitor Seating", "Company Logo Wall", "Coffee Station"],
+            RECEPTION_AREA
         )
 
     def build_conference_rooms(self) -> None:
@@ -70,7 +98,7 @@ class OfficeBuilder:
         ]
 
         for name, capacity, amenities in conference_rooms:
-            self.rooms[name] = Room(name=name, capacity=capacity, amenities=amenities)
+            self._add_room(name, capacity, amenities, CONFERENCE_ROOMS)
 
     def build_team_pods(self) -> None:
         """Build open team working areas."""
@@ -86,7 +114,7 @@ class OfficeBuilder:
         ]
 
         for name, capacity, amenities in team_pods:
-            self.rooms[name] = Room(name=name, capacity=capacity, amenities=amenities)
+            self._add_room(name, capacity, amenities, TEAM_PODS)
 
     def build_private_offices(self) -> None:
         """Build private offices for leadership."""
@@ -99,7 +127,7 @@ class OfficeBuilder:
         ]
 
         for name, capacity, amenities in offices:
-            self.rooms[name] = Room(name=name, capacity=capacity, amenities=amenities)
+            self._add_room(name, capacity, amenities, PRIVATE_OFFICES)
 
     def build_common_areas(self) -> None:
         """Build common areas and amenities."""
@@ -113,8 +141,7 @@ class OfficeBuilder:
         ]
 
         for name, capacity, amenities in common_spaces:
-            self.rooms[name] = Room(name=name, capacity=capacity, amenities=amenities)
-            self.common_areas.append(name)
+            self._add_room(name, capacity, amenities, COMMON_AREAS)
 
     def install_infrastructure(self) -> None:
         """Install technical infrastructure."""
@@ -128,10 +155,10 @@ class OfficeBuilder:
             print("  ⚠️  Office already built!")
             return
 
-        print("\n" + "="*70)
+        print("\n" + _RULE)
         print("  🏗️  NEXUS SOFTWARE SOLUTIONS - OFFICE CONSTRUCTION")
         print("  📍 14th Floor - Downtown Tech District")
-        print("="*70 + "\n")
+        print(_RULE + "\n")
 
         self.build_reception()
         self.build_conference_rooms()
@@ -144,8 +171,8 @@ class OfficeBuilder:
         self.log("Office construction COMPLETE! ✨")
 
         print(f"\n  📊 Total rooms built: {len(self.rooms)}")
-        print(f"  👥 Total capacity: {sum(room.capacity for room in self.rooms.values())} people")
-        print("="*70 + "\n")
+        print(f"  👥 Total capacity: {self.total_capacity} people")
+        print(_RULE + "\n")
 
     def get_room(self, room_name: str) -> Room:
         """Get a specific room by name."""
@@ -154,39 +181,48 @@ class OfficeBuilder:
     def assign_employee_to_room(self, employee_name: str, room_name: str) -> bool:
         """Assign an employee to a room."""
         room = self.get_room(room_name)
-        if room and len(room.occupied_by) < room.capacity:
+        if not room or employee_name in room.occupied_set:
+            return False
+        if room.occupied_count < room.capacity:
             room.occupied_by.append(employee_name)
+            room.occupied_set.add(employee_name)
+            room.occupied_count += 1
             return True
         return False
 
+    @property
+    def common_areas(self) -> List[str]:
+        """Names of the shared common areas."""
+        return list(self._categories[COMMON_AREAS])
+
+    def get_category_rooms(self, category: str) -> Tuple[str, ...]:
+        """Return the names of rooms in a layout category."""
+        return tuple(self._categories.get(category, ()))
+
     def get_office_layout(self) -> Dict[str, Room]:
         """Return the complete office layout."""
         return self.rooms
 
     def display_office(self) -> None:
         """Display a visual representation of the office."""
-        print("\n" + "="*70)
-        print("  🏢 NEXUS SOFTWARE SOLUTIONS - OFFICE LAYOUT")
-        print("="*70 + "\n")
-
-        categories = {
-            "🚪 RECEPTION": ["Reception"],
-            "🤝 CONFERENCE ROOMS": [name for name in self.rooms if "Conference" in name or "War Room" in name],
-            "💻 TEAM PODS": [name for name in self.rooms if "Pod" in name or "Lab" in name or "Suite" in name or "Studio" in name],
-            "👔 PRIVATE OFFICES": [name for name in self.rooms if "Office" in name],
-            "☕ COMMON AREAS": self.common_areas,
-        }
+        lines = [
+            "\n" + _RULE,
+            "  🏢 NEXUS SOFTWARE SOLUTIONS - OFFICE LAYOUT",
+            _RULE + "\n",
+        ]
 
-        for category, room_names in categories.items():
-            print(f"\n{category}")
-            print("-" * 70)
+        for category, room_names in self._categories.items():
+            lines.append(f"\n{category}")
+            lines.append(_THIN_RULE)
             for room_name in room_names:
                 room = self.rooms.get(room_name)
                 if room:
-                    occupancy = f"{len(room.occupied_by)}/{room.capacity}"
-                    print(f"  • {room.name:30} [{occupancy:>6}] - {', '.join(room.amenities[:2])}")
+                    occupancy = f"{room.occupied_count}/{room.capacity}"
+                    lines.append(f"  • {room.name:30} [{occupancy:>6}] - {', '.join(islice(room.amenities, 2))}")
 
-        print("\n" + "="*70 + "\n")
+        lines.append("\n" + _RULE + "\n")
+        # One write for the whole layout instead of a print per line
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
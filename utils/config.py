@@ -42,15 +42,18 @@ PROJECT_CONFIG = {
 }
 
 
+# Category lookup table for get_config
+_CONFIGS = {
+    "office": OFFICE_CONFIG,
+    "simulation": SIMULATION_CONFIG,
+    "display": DISPLAY_CONFIG,
+    "project": PROJECT_CONFIG,
+}
+
+
 def get_config(category: str) -> dict:
     """Get configuration for a specific category."""
-    configs = {
-        "office": OFFICE_CONFIG,
-        "simulation": SIMULATION_CONFIG,
-        "display": DISPLAY_CONFIG,
-        "project": PROJECT_CONFIG,
-    }
-    return configs.get(category, {})
+    return _CONFIGS.get(category, {})
 
 
 if __name__ == "__main__":
@@ -8,38 +8,72 @@ Display Utilities
 Beautiful terminal visualization for the Nexus office simulation.
 """
 
-from typing import List, Dict
-from employees import Employee, Team
+import os
+import sys
+from typing import TYPE_CHECKING, List, Dict
+from .config import DISPLAY_CONFIG
+
+if TYPE_CHECKING:
+    from employees import Employee
+
+# Decided once at import: skip ANSI codes when piped, when NO_COLOR is set,
+# or when colors are disabled in DISPLAY_CONFIG
+_USE_COLOR = (
+    sys.stdout is not None
+    and sys.stdout.isatty()
+    and os.environ.get("NO_COLOR") is None
+    and DISPLAY_CONFIG.get("use_colors", True)
+)
+
+
+def _ansi(code: int) -> str:
+    """Return the ANSI escape for a code, or '' when colors are off."""
+    return f"\033[{code}m" if _USE_COLOR else ""
 
 
 class Display:
     """Handles all visual output for the office simulation."""
 
     # Color codes for terminal (ANSI)
-    RESET = "\033[0m"
-    BOLD = "\033[1m"
-    DIM = "\033[2m"
+    RESET = _ansi(0)
+    BOLD = _ansi(1)
+    DIM = _ansi(2)
 
     # Colors
-    BLUE = "\033[94m"
-    GREEN = "\033[92m"
-    YELLOW = "\033[93m"
-    RED = "\033[91m"
-    CYAN = "\033[96m"
-    MAGENTA = "\033[95m"
+    BLUE = _ansi(94)
+    GREEN = _ansi(92)
+    YELLOW = _ansi(93)
+    RED = _ansi(91)
+    CYAN = _ansi(96)
+    MAGENTA = _ansi(95)
+
+    # Invariant rules and prefixes, built once instead of on every render
+    _EQ_BAR = "=" * 70
+    _DASH_BAR = "-" * 70
+    _SOFT_BAR = "─" * 70
+    _HEADER_PREFIX = f"{BOLD}{BLUE}"
+    _HEADER_SUFFIX = RESET
+    _HEADER_BAR = f"{BOLD}{BLUE}{_EQ_BAR}{RESET}"
+    _BANNER_PREFIX = f"{BOLD}{MAGENTA}"
+    _BANNER_BAR = f"{BOLD}{MAGENTA}{_EQ_BAR}{RESET}"
+    _CODE_BAR = f"{BOLD}{_SOFT_BAR}{RESET}"
+    _SEPARATOR = f"\n{DIM}{_SOFT_BAR}{RESET}\n"
 
     @staticmethod
     def header(text: str) -> None:
         """Display a section header."""
-        print(f"\n{Display.BOLD}{Display.BLUE}{'='*70}{Display.RESET}")
-        print(f"{Display.BOLD}{Display.BLUE}  {text}{Display.RESET}")
-        print(f"{Display.BOLD}{Display.BLUE}{'='*70}{Display.RESET}\n")
+        lines = (
+            f"\n{Display._HEADER_BAR}",
+            f"{Display._HEADER_PREFIX}  {text}{Display._HEADER_SUFFIX}",
+            f"{Display._HEADER_BAR}\n",
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
 
     @staticmethod
     def subheader(text: str) -> None:
         """Display a subsection header."""
         print(f"\n{Display.BOLD}{text}{Display.RESET}")
-        print(f"{'-'*70}")
+        print(Display._DASH_BAR)
 
     @staticmethod
     def success(text: str) -> None:
@@ -62,23 +96,28 @@ class Display:
         print(f"{Display.RED}✗ {text}{Display.RESET}")
 
     @staticmethod
-    def employee_card(employee: Employee) -> None:
+    def employee_card(employee: "Employee") -> None:
         """Display an employee information card."""
-        print(f"\n  {Display.BOLD}{employee.name}{Display.RESET}")
-        print(f"  Role: {employee.role}")
-        print(f"  Team: {Display.CYAN}{employee.team.value}{Display.RESET}")
-        print(f"  Location: {employee.location}")
-        print(f"  Skills: {', '.join([skill.value for skill in employee.skills[:4]])}")
+        lines = [
+            f"\n  {Display.BOLD}{employee.name}{Display.RESET}",
+            f"  Role: {employee.role}",
+            f"  Team: {Display.CYAN}{employee.team.label}{Display.RESET}",
+            f"  Location: {employee.location}",
+            f"  Skills: {', '.join(employee.skill_labels[:4])}",
+        ]
         if employee.quirks:
-            print(f"  Quirk: {Display.YELLOW}{employee.quirks[0]}{Display.RESET}")
+            lines.append(f"  Quirk: {Display.YELLOW}{employee.quirks[0]}{Display.RESET}")
+        print(*lines, sep="\n")
 
     @staticmethod
-    def team_roster(team_name: str, employees: List[Employee]) -> None:
+    def team_roster(team_name: str, employees: List["Employee"]) -> None:
         """Display a team roster."""
-        print(f"\n{Display.BOLD}{Display.CYAN}{team_name}{Display.RESET} ({len(employees)} members)")
-        for emp in employees:
-            status = "🟢" if emp.available else "🔴"
-            print(f"  {status} {emp.name:25} - {emp.role}")
+        lines = [f"\n{Display.BOLD}{Display.CYAN}{team_name}{Display.RESET} ({len(employees)} members)"]
+        lines.extend(
+            f"  {'🟢' if emp.available else '🔴'} {emp.name:<25} - {emp.role}"
+            for emp in employees
+        )
+        sys.stdout.write("\n".join(lines) + "\n")
 
     @staticmethod
     def office_status(total_employees: int, available: int, busy: int) -> None:
@@ -102,24 +141,24 @@ class Display:
     @staticmethod
     def code_block(code: str, author: str, status: str) -> None:
         """Display a code block with metadata."""
-        print(f"\n{Display.BOLD}{'─'*70}{Display.RESET}")
+        print(f"\n{Display._CODE_BAR}")
         print(f"{Display.DIM}Written by: {author} | Status: {status}{Display.RESET}")
-        print(f"{Display.BOLD}{'─'*70}{Display.RESET}")
+        print(Display._CODE_BAR)
         print(code)
-        print(f"{Display.BOLD}{'─'*70}{Display.RESET}\n")
+        print(f"{Display._CODE_BAR}\n")
 
     @staticmethod
     def project_banner(project_name: str, customer: str) -> None:
         """Display project information banner."""
-        print(f"\n{Display.BOLD}{Display.MAGENTA}{'='*70}{Display.RESET}")
-        print(f"{Display.BOLD}{Display.MAGENTA}  📋 PROJECT: {project_name}{Display.RESET}")
-        print(f"{Display.BOLD}{Display.MAGENTA}  👤 CUSTOMER: {customer}{Display.RESET}")
-        print(f"{Display.BOLD}{Display.MAGENTA}{'='*70}{Display.RESET}\n")
+        print(f"\n{Display._BANNER_BAR}")
+        print(f"{Display._BANNER_PREFIX}  📋 PROJECT: {project_name}{Display.RESET}")
+        print(f"{Display._BANNER_PREFIX}  👤 CUSTOMER: {customer}{Display.RESET}")
+        print(f"{Display._BANNER_BAR}\n")
 
     @staticmethod
     def separator() -> None:
         """Display a visual separator."""
-        print(f"\n{Display.DIM}{'─'*70}{Display.RESET}\n")
+        print(Display._SEPARATOR)
 
     @staticmethod
     def welcome_banner() -> None: